@@ -3,27 +3,158 @@ Local Image Generator - No API Keys Required
 ==========================================
 
 Creates artistic images from text prompts using local Python libraries.
-Uses PIL (Pillow), random patterns, gradients, and text rendering.
+Uses PIL (Pillow) and NumPy, random patterns, gradients, and text rendering.
 
 Author: AI Assistant
 Date: July 4, 2025
 """
 
 import os
-import random
+import atexit
+import copy
+import functools
 import math
+import re
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
-from datetime import datetime
+from collections import Counter
 import colorsys
 
+# Numba is optional - the pixel kernels fall back to plain NumPy without it
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    @njit(fastmath=True)
+    def _radial_kernel(out, center_x, center_y, max_distance, c1, c2):
+        """Fill out (H, W, 3) with a radial gradient in a single fused pass"""
+        height, width, _ = out.shape
+        for y in range(height):
+            for x in range(width):
+                ratio = math.sqrt((x - center_x)**2 + (y - center_y)**2) / max_distance
+                if ratio > 1.0:
+                    ratio = 1.0
+                for c in range(3):
+                    out[y, x, c] = np.uint8(c1[c] + (c2[c] - c1[c]) * ratio)
+    
+    @njit(fastmath=True)
+    def _diagonal_kernel(out, c1, c2):
+        """Fill out (H, W, 3) with a diagonal gradient in a single fused pass"""
+        height, width, _ = out.shape
+        for y in range(height):
+            for x in range(width):
+                ratio = (x + y) / (width + height)
+                for c in range(3):
+                    out[y, x, c] = np.uint8(c1[c] + (c2[c] - c1[c]) * ratio)
+    
+    @njit
+    def _blend_shape_kernel(pixels, x0, y0, x1, y1, left, top, right, bottom, ellipse, color, alpha):
+        """Alpha-blend a filled shape with box (x0, y0, x1, y1) over the clipped region"""
+        center_x, center_y = (x0 + x1) / 2, (y0 + y1) / 2
+        radius_x, radius_y = max((x1 - x0) / 2, 0.5), max((y1 - y0) / 2, 0.5)
+        for y in range(top, bottom + 1):
+            for x in range(left, right + 1):
+                if ellipse and ((x - center_x) / radius_x)**2 + ((y - center_y) / radius_y)**2 > 1.0:
+                    continue
+                for c in range(3):
+                    pixels[y, x, c] = (color[c] * alpha + pixels[y, x, c] * (255 - alpha) + 127) // 255
+    
+    @njit
+    def _blend_coverage_kernel(region, coverage, color):
+        """Alpha-blend a solid color over region using a per-pixel coverage mask"""
+        height, width, _ = region.shape
+        for y in range(height):
+            for x in range(width):
+                alpha = np.int64(coverage[y, x])
+                if alpha == 0:
+                    continue
+                for c in range(3):
+                    region[y, x, c] = (color[c] * alpha + region[y, x, c] * (255 - alpha) + 127) // 255
+
+def _blend_over(region, color, alpha):
+    """Alpha-blend a solid color over region in place; alpha is a scalar or (h, w) array in 0-255"""
+    alpha = np.asarray(alpha, dtype=np.uint16)[..., None]
+    region[...] = (color.astype(np.uint16) * alpha + region * (255 - alpha) + 127) // 255
+
+def _blend_shape(pixels, box, ellipse, color, alpha):
+    """Alpha-blend a filled ellipse or rectangle (inclusive box) over pixels in place"""
+    height, width, _ = pixels.shape
+    x0, y0, x1, y1 = box
+    left, top = max(x0, 0), max(y0, 0)
+    right, bottom = min(x1, width - 1), min(y1, height - 1)
+    if right < left or bottom < top:
+        return
+    
+    if HAS_NUMBA:
+        _blend_shape_kernel(pixels, x0, y0, x1, y1, left, top, right, bottom, ellipse, color, alpha)
+        return
+    
+    if ellipse:
+        center_x, center_y = (x0 + x1) / 2, (y0 + y1) / 2
+        radius_x, radius_y = max((x1 - x0) / 2, 0.5), max((y1 - y0) / 2, 0.5)
+        ys, xs = np.ogrid[top:bottom + 1, left:right + 1]
+        inside = ((xs - center_x) / radius_x)**2 + ((ys - center_y) / radius_y)**2 <= 1.0
+        alpha = np.where(inside, alpha, 0)
+    _blend_over(pixels[top:bottom + 1, left:right + 1], color, alpha)
+
+def _blend_mask(pixels, mask, left, top, color):
+    """Alpha-blend a solid color over pixels through an L-mode mask placed at (left, top)"""
+    height, width, _ = pixels.shape
+    mask_height, mask_width = mask.shape
+    x0, y0 = max(left, 0), max(top, 0)
+    x1, y1 = min(left + mask_width, width), min(top + mask_height, height)
+    if x1 <= x0 or y1 <= y0:
+        return
+    
+    region = pixels[y0:y1, x0:x1]
+    coverage = mask[y0 - top:y1 - top, x0 - left:x1 - left]
+    if HAS_NUMBA:
+        _blend_coverage_kernel(region, coverage, color)
+    else:
+        _blend_over(region, color, coverage)
+
+@functools.lru_cache(maxsize=16)
+def _load_font(name, size):
+    """Load a TrueType font once per (name, size), or None if unavailable"""
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        return None
+
 class LocalImageGenerator:
     """Generate artistic images locally without requiring API keys"""
     
-    def __init__(self, output_dir="generated_images"):
-        """Initialize the local image generator"""
+    # Prompt keywords used to pick a color theme
+    THEME_KEYWORDS = {
+        'nature': ['tree', 'grass', 'plant', 'garden', 'nature', 'leaf'],
+        'ocean': ['ocean', 'sea', 'water', 'wave', 'beach', 'blue'],
+        'sunset': ['sunset', 'dawn', 'orange', 'warm', 'golden'],
+        'space': ['space', 'star', 'galaxy', 'cosmic', 'universe', 'nebula'],
+        'forest': ['forest', 'wood', 'jungle', 'tree', 'green'],
+        'city': ['city', 'urban', 'building', 'street', 'skyscraper'],
+        'fire': ['fire', 'flame', 'hot', 'red', 'burning'],
+        'ice': ['ice', 'cold', 'frozen', 'winter', 'snow'],
+        'magic': ['magic', 'mystical', 'fantasy', 'enchanted', 'wizard'],
+        'retro': ['retro', 'neon', 'cyberpunk', '80s', 'synthwave']
+    }
+    
+    def __init__(self, output_dir="generated_images", seed=None):
+        """Initialize the local image generator (pass seed for reproducible images)"""
         self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
         
+        # Single random generator shared by every drawing step; batches spawn
+        # per-prompt child seeds from the same seed sequence
+        self._seed_seq = np.random.SeedSequence(seed)
+        self._rng = np.random.default_rng(self._seed_seq)
+        
         # Color themes for different prompt types
         self.color_themes = {
             'nature': ['#228B22', '#32CD32', '#90EE90', '#006400', '#8FBC8F'],
@@ -38,153 +169,174 @@ class LocalImageGenerator:
             'retro': ['#FF1493', '#00FFFF', '#FFFF00', '#FF69B4', '#00FF00']
         }
         
+        # Pre-parsed RGB values as one (themes, colors, 3) uint8 array plus a
+        # theme name -> row lookup, so hex strings are only kept for display
+        theme_names = list(self.color_themes)
+        self._theme_idx = {theme: i for i, theme in enumerate(theme_names)}
+        self._theme_rgb = np.array(
+            [[[int(c[1:3], 16), int(c[3:5], 16), int(c[5:7], 16)] for c in self.color_themes[theme]]
+             for theme in theme_names],
+            dtype=np.uint8)
+        
+        # PNG encoding runs in the background; pending saves are (filepath, future)
+        self._save_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_saves = []
+        
+        # Inverted keyword index: word -> themes it counts towards
+        self._keyword_to_themes = {}
+        for theme, keywords in self.THEME_KEYWORDS.items():
+            for keyword in keywords:
+                self._keyword_to_themes.setdefault(keyword, []).append(theme)
+        
+        # Artistic filters, instantiated once; None leaves the image untouched
+        self._effects = [
+            ImageFilter.GaussianBlur(radius=1),
+            ImageFilter.SHARPEN,
+            ImageFilter.EMBOSS,
+            ImageFilter.EDGE_ENHANCE,
+            ImageFilter.SMOOTH,
+            None,
+        ]
+        
         print("🎨 Local Image Generator initialized!")
         print("✅ No API keys required - fully offline")
     
+    def _reseeded(self, seed):
+        """Shallow copy of this generator that draws from its own random generator"""
+        clone = copy.copy(self)
+        clone._rng = np.random.default_rng(seed)
+        return clone
+    
+    def _randint(self, low, high):
+        """Random integer in [low, high], like random.randint"""
+        return int(self._rng.integers(low, high + 1))
+    
+    def _choice(self, options):
+        """Random element of a sequence, like random.choice"""
+        return options[self._rng.integers(len(options))]
+    
+    def _themes_for_word(self, word):
+        """Themes a prompt word counts towards, or None if it is not a keyword"""
+        themes = self._keyword_to_themes.get(word)
+        if themes is None and word.endswith('s'):
+            themes = self._keyword_to_themes.get(word[:-1])  # simple plurals
+        return themes
+    
     def detect_theme(self, prompt):
         """Detect the theme from the prompt to choose appropriate colors"""
-        prompt_lower = prompt.lower()
-        
-        theme_keywords = {
-            'nature': ['tree', 'grass', 'plant', 'garden', 'nature', 'leaf'],
-            'ocean': ['ocean', 'sea', 'water', 'wave', 'beach', 'blue'],
-            'sunset': ['sunset', 'dawn', 'orange', 'warm', 'golden'],
-            'space': ['space', 'star', 'galaxy', 'cosmic', 'universe', 'nebula'],
-            'forest': ['forest', 'wood', 'jungle', 'tree', 'green'],
-            'city': ['city', 'urban', 'building', 'street', 'skyscraper'],
-            'fire': ['fire', 'flame', 'hot', 'red', 'burning'],
-            'ice': ['ice', 'cold', 'frozen', 'winter', 'snow'],
-            'magic': ['magic', 'mystical', 'fantasy', 'enchanted', 'wizard'],
-            'retro': ['retro', 'neon', 'cyberpunk', '80s', 'synthwave']
-        }
+        words = re.findall(r"\w+", prompt.lower())
         
-        # Count keyword matches for each theme
-        theme_scores = {}
-        for theme, keywords in theme_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in prompt_lower)
-            if score > 0:
-                theme_scores[theme] = score
+        # A one-word prompt has nothing to outvote its keyword, so skip the scoring
+        if len(words) == 1:
+            themes = self._themes_for_word(words[0])
+            if themes:
+                return themes[0]
+        
+        # Count keyword matches for each theme, one dict lookup per word
+        theme_scores = Counter()
+        for word in words:
+            themes = self._themes_for_word(word)
+            if themes:
+                theme_scores.update(themes)
         
         # Return theme with highest score, or random theme if no matches
         if theme_scores:
-            return max(theme_scores.items(), key=lambda x: x[1])[0]
+            return theme_scores.most_common(1)[0][0]
         else:
-            return random.choice(list(self.color_themes.keys()))
+            return self._choice(list(self.color_themes.keys()))
     
     def generate_gradient_background(self, width, height, colors):
-        """Generate a gradient background"""
-        image = Image.new('RGB', (width, height))
-        draw = ImageDraw.Draw(image)
+        """Generate a gradient background as an (height, width, 3) uint8 array"""
+        # Endpoint colors as float RGB vectors for the blend
+        c1 = colors[0].astype(np.float32)
+        c2 = colors[1].astype(np.float32)
         
         # Choose gradient direction
-        gradient_type = random.choice(['horizontal', 'vertical', 'diagonal', 'radial'])
+        gradient_type = self._choice(['horizontal', 'vertical', 'diagonal', 'radial'])
+        
+        center_x, center_y = width // 2, height // 2
+        max_distance = math.sqrt(center_x**2 + center_y**2)
         
+        # Per-pixel gradients are written straight into the output buffer by Numba
+        if HAS_NUMBA and gradient_type in ('diagonal', 'radial'):
+            pixels = np.empty((height, width, 3), dtype=np.uint8)
+            if gradient_type == 'radial':
+                _radial_kernel(pixels, center_x, center_y, max_distance, c1, c2)
+            else:
+                _diagonal_kernel(pixels, c1, c2)
+            return pixels
+        
+        # Build the blend ratio field quantized to 0-255, broadcastable to (height, width)
         if gradient_type == 'horizontal':
-            for x in range(width):
-                ratio = x / width
-                color = self.blend_colors(colors[0], colors[1], ratio)
-                draw.line([(x, 0), (x, height)], fill=color)
-                
+            ratio_q8 = (np.arange(width, dtype=np.uint32) * 255 // width).astype(np.uint8)[None, :]
+            
         elif gradient_type == 'vertical':
-            for y in range(height):
-                ratio = y / height
-                color = self.blend_colors(colors[0], colors[1], ratio)
-                draw.line([(0, y), (width, y)], fill=color)
-                
+            ratio_q8 = (np.arange(height, dtype=np.uint32) * 255 // height).astype(np.uint8)[:, None]
+            
         elif gradient_type == 'diagonal':
-            for y in range(height):
-                for x in range(width):
-                    ratio = (x + y) / (width + height)
-                    color = self.blend_colors(colors[0], colors[1], ratio)
-                    draw.point((x, y), fill=color)
+            ratio_q8 = (np.add.outer(np.arange(height, dtype=np.uint32), np.arange(width, dtype=np.uint32))
+                        * 255 // (width + height)).astype(np.uint8)
                     
         elif gradient_type == 'radial':
-            center_x, center_y = width // 2, height // 2
-            max_distance = math.sqrt(center_x**2 + center_y**2)
-            
-            for y in range(height):
-                for x in range(width):
-                    distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                    ratio = min(distance / max_distance, 1.0)
-                    color = self.blend_colors(colors[0], colors[1], ratio)
-                    draw.point((x, y), fill=color)
-        
-        return image
-    
-    def blend_colors(self, color1, color2, ratio):
-        """Blend two hex colors based on ratio (0.0 to 1.0)"""
-        # Convert hex to RGB
-        r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
-        r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
-        
-        # Blend
-        r = int(r1 + (r2 - r1) * ratio)
-        g = int(g1 + (g2 - g1) * ratio)
-        b = int(b1 + (b2 - b1) * ratio)
-        
-        return (r, g, b)
+            ys = np.arange(height, dtype=np.float32)[:, None] - center_y
+            xs = np.arange(width, dtype=np.float32)[None, :] - center_x
+            distance = np.hypot(xs, ys)
+            ratio_q8 = (np.minimum(distance / max_distance, 1.0) * 255).astype(np.uint8)
+        
+        # Blend both endpoint colors through a 256-entry lookup table, so the
+        # full-size buffer is only ever written as uint8
+        lut = (c1 + (c2 - c1) * (np.arange(256, dtype=np.float32)[:, None] / 255)).astype(np.uint8)
+        return np.broadcast_to(lut[ratio_q8], (height, width, 3)).copy()
     
-    def add_geometric_patterns(self, image, colors):
-        """Add geometric patterns to the image"""
-        draw = ImageDraw.Draw(image)
-        width, height = image.size
-        
-        pattern_type = random.choice(['circles', 'rectangles', 'triangles', 'lines'])
-        num_shapes = random.randint(5, 15)
-        
-        for _ in range(num_shapes):
-            color = random.choice(colors)
-            alpha = random.randint(50, 150)
+    def add_geometric_patterns(self, pixels, colors):
+        """Add geometric patterns to the (height, width, 3) pixel array in place"""
+        height, width, _ = pixels.shape
+        
+        pattern_type = self._choice(['circles', 'rectangles', 'triangles', 'lines'])
+        num_shapes = self._randint(5, 15)
+        
+        # Draw all random shape parameters up front
+        rng = self._rng
+        if pattern_type == 'circles':
+            x = rng.integers(0, width + 1, num_shapes)
+            y = rng.integers(0, height + 1, num_shapes)
+            radius = rng.integers(20, 101, num_shapes)
             
-            # Create a semi-transparent overlay
-            overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-            overlay_draw = ImageDraw.Draw(overlay)
+            ellipse = True
+            boxes = np.stack([x - radius, y - radius, x + radius, y + radius], axis=1).tolist()
             
-            if pattern_type == 'circles':
-                x = random.randint(0, width)
-                y = random.randint(0, height)
-                radius = random.randint(20, 100)
-                
-                # Convert hex to RGB and add alpha
-                r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
-                circle_color = (r, g, b, alpha)
-                
-                overlay_draw.ellipse([x-radius, y-radius, x+radius, y+radius], 
-                                   fill=circle_color)
-                
-            elif pattern_type == 'rectangles':
-                x1 = random.randint(0, width//2)
-                y1 = random.randint(0, height//2)
-                x2 = random.randint(x1, width)
-                y2 = random.randint(y1, height)
-                
-                r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
-                rect_color = (r, g, b, alpha)
-                
-                overlay_draw.rectangle([x1, y1, x2, y2], fill=rect_color)
+        elif pattern_type == 'rectangles':
+            x1 = rng.integers(0, width//2 + 1, num_shapes)
+            y1 = rng.integers(0, height//2 + 1, num_shapes)
+            x2 = rng.integers(x1, width + 1)
+            y2 = rng.integers(y1, height + 1)
             
-            # Composite the overlay onto the main image
-            image = Image.alpha_composite(image.convert('RGBA'), overlay).convert('RGB')
+            ellipse = False
+            boxes = np.stack([x1, y1, x2, y2], axis=1).tolist()
         
-        return image
-    
-    def add_text_overlay(self, image, prompt):
-        """Add artistic text overlay to the image"""
-        draw = ImageDraw.Draw(image)
-        width, height = image.size
+        else:
+            # Triangles and lines have no renderer yet, so nothing is drawn
+            return pixels
         
-        # Try to load a font, fallback to default
-        try:
-            # Try different font sizes
-            for font_size in [60, 48, 36, 24]:
-                try:
-                    font = ImageFont.truetype("arial.ttf", font_size)
-                    break
-                except:
-                    continue
-            else:
-                font = ImageFont.load_default()
-        except:
+        fill_colors = colors[rng.integers(0, len(colors), num_shapes)]
+        alphas = rng.integers(50, 151, num_shapes).tolist()
+        
+        # Blend each semi-transparent shape straight into the pixels it covers
+        for box, color, alpha in zip(boxes, fill_colors, alphas):
+            _blend_shape(pixels, box, ellipse, color, alpha)
+        
+        return pixels
+    
+    def add_text_overlay(self, pixels, prompt):
+        """Add artistic text overlay to the (height, width, 3) pixel array in place"""
+        height, width, _ = pixels.shape
+        
+        # Try different font sizes, fallback to default
+        for font_size in [60, 48, 36, 24]:
+            font = _load_font("arial.ttf", font_size)
+            if font:
+                break
+        else:
             font = ImageFont.load_default()
         
         # Prepare text (use first few words of prompt)
@@ -192,7 +344,7 @@ class LocalImageGenerator:
         display_text = " ".join(words).upper()
         
         # Get text dimensions
-        bbox = draw.textbbox((0, 0), display_text, font=font)
+        bbox = font.getbbox(display_text)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         
@@ -204,74 +356,67 @@ class LocalImageGenerator:
             (width - text_width - 50, height//2 - text_height//2),  # Right center
         ]
         
-        x, y = random.choice(text_positions)
+        x, y = self._choice(text_positions)
+        
+        # Rasterize the glyphs once into a small mask shared by shadow and text
+        mask_image = Image.new('L', (max(bbox[2], 1), max(bbox[3], 1)), 0)
+        ImageDraw.Draw(mask_image).text((0, 0), display_text, fill=255, font=font)
+        mask = np.array(mask_image)
         
         # Add text shadow
         shadow_offset = 3
-        draw.text((x + shadow_offset, y + shadow_offset), display_text, 
-                 fill='black', font=font)
+        _blend_mask(pixels, mask, x + shadow_offset, y + shadow_offset,
+                    np.array([0, 0, 0], dtype=np.uint8))
         
         # Add main text
-        draw.text((x, y), display_text, fill='white', font=font)
+        _blend_mask(pixels, mask, x, y, np.array([255, 255, 255], dtype=np.uint8))
         
-        return image
+        return pixels
     
     def apply_artistic_effects(self, image):
-        """Apply artistic effects to the image"""
-        effects = ['blur', 'sharpen', 'emboss', 'edge_enhance', 'smooth']
-        chosen_effect = random.choice(effects)
-        
-        if chosen_effect == 'blur':
-            image = image.filter(ImageFilter.GaussianBlur(radius=1))
-        elif chosen_effect == 'sharpen':
-            image = image.filter(ImageFilter.SHARPEN)
-        elif chosen_effect == 'emboss':
-            image = image.filter(ImageFilter.EMBOSS)
-        elif chosen_effect == 'edge_enhance':
-            image = image.filter(ImageFilter.EDGE_ENHANCE)
-        elif chosen_effect == 'smooth':
-            image = image.filter(ImageFilter.SMOOTH)
-        
-        return image
+        """
+        Apply artistic effects to the image
+        
+        The 3x3 convolution filters pick up SSE4/AVX2 acceleration for free
+        when Pillow-SIMD is installed in place of Pillow.
+        """
+        chosen_effect = self._choice(self._effects)
+        
+        return image if chosen_effect is None else image.filter(chosen_effect)
     
     def create_abstract_art(self, width, height, colors):
-        """Create abstract art patterns"""
+        """Create abstract art patterns as an (height, width, 3) uint8 array"""
         image = Image.new('RGB', (width, height), 'white')
         draw = ImageDraw.Draw(image)
+        rng = self._rng
         
-        # Create random abstract shapes
-        num_shapes = random.randint(10, 25)
+        # Draw all random shape parameters up front
+        num_shapes = rng.integers(10, 26)
+        shape_types = rng.integers(0, 3, num_shapes)  # 0 ellipse, 1 rectangle, 2 polygon
+        x1 = rng.integers(0, width//2 + 1, num_shapes)
+        y1 = rng.integers(0, height//2 + 1, num_shapes)
+        x2 = rng.integers(x1, width + 1)
+        y2 = rng.integers(y1, height + 1)
+        num_points = rng.integers(3, 7, num_shapes)
+        points = np.stack([rng.integers(0, width + 1, (num_shapes, 6)),
+                           rng.integers(0, height + 1, (num_shapes, 6))], axis=2)
         
-        for _ in range(num_shapes):
-            shape_type = random.choice(['ellipse', 'rectangle', 'polygon'])
-            color = random.choice(colors)
-            
-            if shape_type == 'ellipse':
-                x1 = random.randint(0, width//2)
-                y1 = random.randint(0, height//2)
-                x2 = random.randint(x1, width)
-                y2 = random.randint(y1, height)
-                draw.ellipse([x1, y1, x2, y2], fill=color)
-                
-            elif shape_type == 'rectangle':
-                x1 = random.randint(0, width//2)
-                y1 = random.randint(0, height//2)
-                x2 = random.randint(x1, width)
-                y2 = random.randint(y1, height)
-                draw.rectangle([x1, y1, x2, y2], fill=color)
-                
-            elif shape_type == 'polygon':
-                points = []
-                num_points = random.randint(3, 6)
-                for _ in range(num_points):
-                    x = random.randint(0, width)
-                    y = random.randint(0, height)
-                    points.append((x, y))
-                draw.polygon(points, fill=color)
-        
-        return image
+        boxes = np.stack([x1, y1, x2, y2], axis=1).tolist()
+        fills = [tuple(c) for c in colors[rng.integers(0, len(colors), num_shapes)].tolist()]
+        
+        # Create random abstract shapes, one loop per shape type
+        for i in np.flatnonzero(shape_types == 0):
+            draw.ellipse(boxes[i], fill=fills[i])
+        
+        for i in np.flatnonzero(shape_types == 1):
+            draw.rectangle(boxes[i], fill=fills[i])
+        
+        for i in np.flatnonzero(shape_types == 2):
+            draw.polygon([tuple(p) for p in points[i, :num_points[i]].tolist()], fill=fills[i])
+        
+        return np.array(image)
     
-    def generate_image(self, prompt, width=800, height=600, style='auto'):
+    def generate_image(self, prompt, width=800, height=600, style='auto', wait=True):
         """
         Generate an artistic image based on the text prompt
         
@@ -280,9 +425,11 @@ class LocalImageGenerator:
             width (int): Image width
             height (int): Image height
             style (str): Generation style - 'gradient', 'abstract', 'geometric', or 'auto'
+            wait (bool): Block until the PNG is written; with False the save runs in
+                the background and callers must call wait_for_saves() before using the file
         
         Returns:
-            str: Path to the generated image
+            str: Path to the generated image, or None if generation or saving failed
         """
         if not prompt or not prompt.strip():
             print("❌ Prompt cannot be empty")
@@ -293,46 +440,54 @@ class LocalImageGenerator:
         
         # Detect theme and get colors
         theme = self.detect_theme(prompt)
-        colors = self.color_themes[theme]
+        colors = self._theme_rgb[self._theme_idx[theme]]
         print(f"🎭 Detected theme: {theme}")
         
         # Choose style
         if style == 'auto':
-            style = random.choice(['gradient', 'abstract', 'geometric'])
+            style = self._choice(['gradient', 'abstract', 'geometric'])
         
         print(f"🖌️ Using style: {style}")
         
         try:
-            # Generate base image based on style
+            # Generate base pixels based on style; everything up to the
+            # filter works on one (height, width, 3) uint8 buffer
             if style == 'gradient':
-                image = self.generate_gradient_background(width, height, colors[:2])
+                pixels = self.generate_gradient_background(width, height, colors[:2])
                 
             elif style == 'abstract':
-                image = self.create_abstract_art(width, height, colors)
+                pixels = self.create_abstract_art(width, height, colors)
                 
             elif style == 'geometric':
                 # Start with solid color background
-                bg_color = colors[0]
-                r, g, b = int(bg_color[1:3], 16), int(bg_color[3:5], 16), int(bg_color[5:7], 16)
-                image = Image.new('RGB', (width, height), (r, g, b))
+                pixels = np.empty((height, width, 3), dtype=np.uint8)
+                pixels[...] = colors[0]
                 
                 # Add geometric patterns
-                image = self.add_geometric_patterns(image, colors[1:])
+                pixels = self.add_geometric_patterns(pixels, colors[1:])
             
             # Add text overlay
-            image = self.add_text_overlay(image, prompt)
+            pixels = self.add_text_overlay(pixels, prompt)
             
-            # Apply artistic effects
-            image = self.apply_artistic_effects(image)
+            # Apply artistic effects, handing the buffer to PIL only now
+            image = self.apply_artistic_effects(Image.fromarray(pixels, 'RGB'))
             
             # Save image
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"local_generated_{style}_{timestamp}.png"
+            filename = f"local_generated_{style}_{time.time_ns()}.png"
             filepath = os.path.join(self.output_dir, filename)
-            image.save(filepath)
+            future = self._save_pool.submit(image.save, filepath,
+                                            optimize=False, compress_level=1)
+            if wait:
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Error saving image {filepath}: {e}")
+                    return None
+            else:
+                self._pending_saves.append((filepath, future))
             
             print(f"✅ Image generated successfully!")
-            print(f"📁 Saved to: {filepath}")
+            print(f"📁 Saved to: {filepath}" if wait else f"📁 Saving to: {filepath}")
             print(f"🎨 Theme: {theme} | Style: {style}")
             
             return filepath
@@ -341,23 +496,101 @@ class LocalImageGenerator:
             print(f"❌ Error generating image: {e}")
             return None
     
-    def batch_generate(self, prompts, **kwargs):
-        """Generate multiple images from a list of prompts"""
-        results = []
+    def batch_generate(self, prompts, use_processes=False, **kwargs):
+        """
+        Generate multiple images from a list of prompts in parallel
+        
+        Args:
+            prompts (list): Text descriptions, one image per prompt
+            use_processes (bool): Use a process pool instead of a thread pool. Worker
+                processes are spawned and re-import the calling script, so it must
+                guard its entry point with if __name__ == "__main__"
+            **kwargs: Extra arguments forwarded to generate_image
+        
+        Returns:
+            list: Paths to the generated images (None for failures), in prompt order
+        """
+        if 'wait' in kwargs:
+            raise TypeError("batch_generate() always saves in the background; "
+                            "call wait_for_saves() instead of passing wait")
+        
         total = len(prompts)
         
         print(f"🔄 Starting batch generation of {total} images...")
         
-        for i, prompt in enumerate(prompts, 1):
-            print(f"\n[{i}/{total}] Processing: '{prompt[:50]}...'")
-            result = self.generate_image(prompt, **kwargs)
-            results.append(result)
+        # Every spawned worker re-imports NumPy, Numba and Pillow, so never start more than needed
+        max_workers = max(1, min(total, os.cpu_count() or 1))
+        if use_processes:
+            # Spawn fresh workers rather than forking a process with live save threads
+            executor = ProcessPoolExecutor(max_workers=max_workers,
+                                           mp_context=multiprocessing.get_context('spawn'),
+                                           initializer=_init_worker, initargs=(self.output_dir,))
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        # One child seed per prompt keeps seeded batches reproducible whichever executor runs them
+        seeds = self._seed_seq.spawn(total)
+        with executor:
+            futures = []
+            for i, (prompt, seed) in enumerate(zip(prompts, seeds), 1):
+                print(f"\n[{i}/{total}] Processing: '{prompt[:50]}...'")
+                if use_processes:
+                    futures.append(executor.submit(_gen_one, self.output_dir, prompt, seed, kwargs))
+                else:
+                    futures.append(executor.submit(self._reseeded(seed).generate_image,
+                                                   prompt, wait=False, **kwargs))
+            
+            results = []
+            for future, prompt, seed in zip(futures, prompts, seeds):
+                try:
+                    results.append(future.result())
+                except BrokenProcessPool:
+                    # A worker died (e.g. the caller has no __main__ guard); render here instead
+                    print(f"⚠️ Worker pool failed, generating '{prompt[:50]}' in this process")
+                    results.append(self._reseeded(seed).generate_image(prompt, wait=False, **kwargs))
+        
+        # Drop images whose background save failed. Worker processes join their
+        # own saves on exit, and a failed PNG save leaves no file behind
+        failed = self.wait_for_saves()
+        results = [r if r is not None and r not in failed and os.path.exists(r) else None
+                   for r in results]
         
         successful = sum(1 for r in results if r is not None)
         print(f"\n📊 Batch generation complete!")
         print(f"✅ Successful: {successful}/{total}")
         
         return results
+    
+    def wait_for_saves(self):
+        """
+        Block until every queued image save has finished
+        
+        Returns:
+            list: Paths of the images that failed to save
+        """
+        failed = []
+        for filepath, future in self._pending_saves:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"❌ Error saving image {filepath}: {e}")
+                failed.append(filepath)
+        
+        self._pending_saves.clear()
+        return failed
+
+@functools.lru_cache(maxsize=None)
+def get_generator(output_dir="generated_images"):
+    """Return the shared LocalImageGenerator for output_dir, creating it on first use"""
+    return LocalImageGenerator(output_dir)
+
+def _init_worker(output_dir):
+    """Set up a batch worker process to finish its pending saves on exit"""
+    atexit.register(get_generator(output_dir).wait_for_saves)
+
+def _gen_one(output_dir, prompt, seed, kwargs):
+    """Generate a single image in a worker process, leaving its save in the background"""
+    generator = get_generator(output_dir)._reseeded(seed)
+    return generator.generate_image(prompt, wait=False, **kwargs)
 
 def main():
     """Interactive demo of the local image generator"""
@@ -368,7 +601,7 @@ def main():
     print("🖼️ Creates artistic images using local Python libraries")
     print()
     
-    generator = LocalImageGenerator()
+    generator = get_generator()
     
     # Example prompts
     example_prompts = [
@@ -1,8 +1,8 @@
 import os
-from Projects.ImageGenerator import LocalImageGenerator
+from Projects.ImageGenerator import get_generator
 
 # Initialize the generator
-generator = LocalImageGenerator()
+generator = get_generator()
 
 # Generate the image
 result = generator.generate_image("Mystical forest with glowing mushrooms")